@@ -1,6 +1,7 @@
 from typing import Annotated, Optional
-from typing import List, Optional, Literal, Dict, Any
+from typing import List, Optional, Literal, Dict, Any, Callable, Tuple
 import os
+import collections
 import pathspec
 import asyncio
 from mcp.server import Server, NotificationOptions
@@ -12,10 +13,20 @@ from pydantic import BaseModel, Field
 import datetime
 from pathlib import Path
 import fnmatch
+import re
 import shutil
+import stat
+import threading
 import json
+try:
+    import orjson
+except ImportError:  # optional, falls back to the stdlib encoder
+    orjson = None
 
-
+# Configuration constants
+DIRECTORY_TREE_CONCURRENCY = 32  # directories scanned per batch by directory_tree
+LARGE_FILE_THRESHOLD = 4 << 20  # files above this size are read in raw chunks
+IO_CHUNK_SIZE = 1 << 20
 
 
 def expand_home(p: str) -> str:
@@ -24,42 +35,107 @@ def expand_home(p: str) -> str:
 def normalize_path(p: str) -> str:
     return os.path.normpath(Path(p).resolve().as_posix())
 
+_DENIED_CACHE_SIZE = 2048
+_denied_cache: "collections.OrderedDict[str, str]" = collections.OrderedDict()
+# validate_path is also called from worker threads (asyncio.to_thread)
+_denied_lock = threading.Lock()
+
+# Allowed directories as a trie of path components, built by get_allowed_directories
+_TRIE_END = object()
+_allowed_trie: Dict[Any, Any] = {}
+
+def _path_parts(p: str) -> List[str]:
+    return [part for part in p.split(os.sep) if part]
+
+def _build_allowed_trie(directories: List[str]) -> Dict[Any, Any]:
+    trie: Dict[Any, Any] = {}
+    for d in directories:
+        node = trie
+        for part in _path_parts(d):
+            node = node.setdefault(part, {})
+        node[_TRIE_END] = True
+    return trie
+
+def _is_allowed(normalized_path: str) -> bool:
+    # True when some allowed directory is a component-wise prefix of the path
+    node = _allowed_trie
+    if _TRIE_END in node:
+        return True
+    for part in _path_parts(normalized_path):
+        node = node.get(part)
+        if node is None:
+            return False
+        if _TRIE_END in node:
+            return True
+    return False
+
 def validate_path(requested_path: str) -> str:
-    global allowed_directories
+    # Short-circuit paths that were recently rejected
+    with _denied_lock:
+        denied = _denied_cache.get(requested_path)
+        if denied is not None:
+            _denied_cache.move_to_end(requested_path)
+    if denied is not None:
+        raise ValueError(denied)
+    try:
+        return _resolve_allowed_path(requested_path)
+    except ValueError as e:
+        with _denied_lock:
+            _denied_cache[requested_path] = str(e)
+            if len(_denied_cache) > _DENIED_CACHE_SIZE:
+                _denied_cache.popitem(last=False)
+        raise
+
+def _resolve_allowed_path(requested_path: str) -> str:
     expanded = expand_home(requested_path)
-    abs_path = Path(expanded).resolve() if Path(expanded).is_absolute() \
-               else (Path.cwd() / expanded).resolve()
-    normalized_requested = normalize_path(abs_path)
+    abs_path = expanded if os.path.isabs(expanded) else os.path.join(os.getcwd(), expanded)
+    denied = f"Access denied – path outside allowed directories: {abs_path}"
 
-    # Check if path is within allowed directories
-    if not any(normalized_requested.startswith(d) for d in allowed_directories):
-        raise ValueError(f"Access denied – path outside allowed directories: {abs_path}")
+    # Check the non-strict resolution first, so a path outside the allowed
+    # directories is rejected the same way whether or not it exists
+    if not _is_allowed(os.path.normpath(os.path.realpath(abs_path))):
+        raise ValueError(denied)
 
     try:
-        # Handle symlinks by checking their real path
-        real_path = Path(os.path.realpath(abs_path))
-        normalized_real = normalize_path(real_path)
-        if not any(normalized_real.startswith(d) for d in allowed_directories):
-            raise ValueError("Access denied – symlink target outside allowed directories")
-        return str(real_path)  # symlink OK
+        # A single realpath resolves symlinks and normalizes the path
+        real_path = os.path.realpath(abs_path, strict=True)
     except FileNotFoundError:
-        # For new files that don't exist yet, verify parent directory
-        parent_dir = abs_path.parent
-        try:
-            real_parent = Path(os.path.realpath(parent_dir))
-        except FileNotFoundError:
-            raise ValueError(f"Parent directory does not exist: {parent_dir}")
+        # For new files and directories, resolve the deepest existing
+        # ancestor and re-append the components that don't exist yet
+        head = abs_path.rstrip(os.sep + (os.altsep or ''))
+        missing = []
+        while True:
+            head, name = os.path.split(head)
+            missing.append(name)
+            try:
+                real_head = os.path.realpath(head, strict=True)
+                break
+            except FileNotFoundError:
+                continue
+        real_path = os.path.normpath(os.path.join(real_head, *reversed(missing)))
+        # A dangling symlink would let a write create its target anywhere
+        if os.path.islink(real_path):
+            raise ValueError(f"Access denied – dangling symlink: {abs_path}")
+
+    if not _is_allowed(real_path):
+        raise ValueError(denied)
+    return real_path
 
-        normalized_parent = normalize_path(real_parent)
-        if not any(normalized_parent.startswith(d) for d in allowed_directories):
-            raise ValueError("Access denied – parent directory outside allowed directories")
-        return str(abs_path) 
+def invalidate_path_cache() -> None:
+    # A denied path may become valid once the file system has been modified
+    with _denied_lock:
+        _denied_cache.clear()
 
 def get_allowed_directories(args):
-    return [
+    global _allowed_trie
+    directories = [
         normalize_path(os.path.abspath(expand_home(arg)))
         for arg in args
     ]
+    # The list is kept for list_allowed_directories, the trie for validation
+    _allowed_trie = _build_allowed_trie(directories)
+    invalidate_path_cache()
+    return directories
 
 
 """ Schema definitions """
@@ -104,62 +180,297 @@ class SearchFilesArgsSchema(BaseModel):
 class GetFileInfoArgsSchema(BaseModel):
     path: str
 
+# Tool definitions are fixed, so their JSON schemas are generated once at import
+_TOOLS_LIST = [
+    types.Tool(
+        name="read_file",
+        description=(
+            "Read the complete contents of a file from the file system. "
+            "Handles various text encodings and provides detailed error messages "
+            "if the file cannot be read. Use this tool when you need to examine "
+            "the contents of a single file. Only works within allowed directories."
+        ),
+        inputSchema=ReadFileArgsSchema.model_json_schema(),
+    ),
+    types.Tool(
+        name="read_multiple_files",
+        description=(
+            "Read the contents of multiple files simultaneously. This is more "
+            "efficient than reading files one by one when you need to analyze "
+            "or compare multiple files. Each file's content is returned with its "
+            "path as a reference. Failed reads for individual files won't stop "
+            "the entire operation. Only works within allowed directories."
+        ),
+        inputSchema=ReadMultipleFilesArgsSchema.model_json_schema(),
+    ),
+    types.Tool(
+        name="write_file",
+        description=(
+            "Create a new file or completely overwrite an existing file with new content. "
+            "Use with caution as it will overwrite existing files without warning. "
+            "Handles text content with proper encoding. Only works within allowed directories."
+        ),
+        inputSchema=WriteFileArgsSchema.model_json_schema(),
+    ),
+    types.Tool(
+        name="edit_file",
+        description=(
+            "Make line-based edits to a text file. Each edit replaces exact line sequences "
+            "with new content. Returns a git-style diff showing the changes made. "
+            "Only works within allowed directories."
+        ),
+        inputSchema=EditFileArgsSchema.model_json_schema(),
+    ),
+    types.Tool(
+        name="create_directory",
+        description=(
+            "Create a new directory or ensure a directory exists. Can create multiple "
+            "nested directories in one operation. If the directory already exists, "
+            "this operation will succeed silently. Perfect for setting up directory "
+            "structures for projects or ensuring required paths exist. Only works within allowed directories."
+        ),
+        inputSchema=CreateDirectoryArgsSchema.model_json_schema(),
+    ),
+    types.Tool(
+        name="list_directory",
+        description=(
+            "Get a detailed listing of all files and directories in a specified path. "
+            "Results clearly distinguish between files and directories with [FILE] and [DIR] "
+            "prefixes. This tool is essential for understanding directory structure and "
+            "finding specific files within a directory. Only works within allowed directories."
+        ),
+        inputSchema=ListDirectoryArgsSchema.model_json_schema(),
+    ),
+    types.Tool(
+        name="directory_tree",
+        description=(
+            "Get a recursive tree view of files and directories as a JSON structure. "
+            "Each entry includes 'name', 'type' (file/directory), and 'children' for directories. "
+            "Files have no children array, while directories always have a children array (which may be empty). "
+            "The output is formatted with 2-space indentation for readability. Only works within allowed directories."
+        ),
+        inputSchema=DirectoryTreeArgsSchema.model_json_schema(),
+    ),
+    types.Tool(
+        name="move_file",
+        description=(
+            "Move or rename files and directories. Can move files between directories "
+            "and rename them in a single operation. If the destination exists, the "
+            "operation will fail. Works across different directories and can be used "
+            "for simple renaming within the same directory. Both source and destination must be within allowed directories."
+        ),
+        inputSchema=MoveFileArgsSchema.model_json_schema(),
+    ),
+    types.Tool(
+        name="search_files",
+        description=(
+            "Recursively search for files and directories matching a pattern. "
+            "Searches through all subdirectories from the starting path. The search "
+            "is case-insensitive and matches partial names. Returns full paths to all "
+            "matching items. Great for finding files when you don't know their exact location. "
+            "Only searches within allowed directories."
+        ),
+        inputSchema=SearchFilesArgsSchema.model_json_schema(),
+    ),
+    types.Tool(
+        name="get_file_info",
+        description=(
+            "Retrieve detailed metadata about a file or directory. Returns comprehensive "
+            "information including size, creation time, last modified time, permissions, "
+            "and type. This tool is perfect for understanding file characteristics "
+            "without reading the actual content. Only works within allowed directories."
+        ),
+        inputSchema=GetFileInfoArgsSchema.model_json_schema(),
+    ),
+    types.Tool(
+        name="list_allowed_directories",
+        description=(
+            "Returns the list of directories that this server is allowed to access. "
+            "Use this to understand which directories are available before trying to access files."
+        ),
+        inputSchema={"type": "object", "properties": {}, "required": []},
+    ),
+]
+
+
 # Tool implementations
-async def get_file_stats(file_path: str) -> Dict[str, Any]:
-    stats = os.stat(file_path)
+class StatCache:
+    """Memoizes os.stat for the lifetime of a single tool call."""
+
+    def __init__(self) -> None:
+        self._stats: Dict[str, os.stat_result] = {}
+
+    def stat(self, path: str) -> os.stat_result:
+        result = self._stats.get(path)
+        if result is None:
+            result = self._stats[path] = os.stat(path)
+        return result
+
+    def is_dir(self, path: str) -> bool:
+        return stat.S_ISDIR(self.stat(path).st_mode)
+
+    def is_file(self, path: str) -> bool:
+        return stat.S_ISREG(self.stat(path).st_mode)
+
+def _read_file(file_path: str, stat_cache: Optional[StatCache] = None) -> str:
+    stat_cache = stat_cache or StatCache()
+    if stat_cache.stat(file_path).st_size <= LARGE_FILE_THRESHOLD:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return f.read()
+
+    # Large files: collect raw bytes and decode once instead of decoding per buffer
+    data = bytearray()
+    with open(file_path, 'rb', buffering=IO_CHUNK_SIZE) as f:
+        while chunk := f.read(IO_CHUNK_SIZE):
+            data += chunk
+    content = data.decode('utf-8')
+    if '\r' in content:
+        # Match the universal-newline translation of text mode
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+def _write_file(file_path: str, content: str) -> None:
+    # Write the encoded bytes straight to the fd, skipping Python's write buffer
+    data = memoryview(content.encode('utf-8'))
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        offset = 0
+        while offset < len(data):
+            offset += os.write(fd, data[offset:offset + IO_CHUNK_SIZE])
+    finally:
+        os.close(fd)
+
+def _read_validated(file_path: str) -> str:
+    return _read_file(validate_path(file_path))
+
+def _dump_json(data: Any) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+        except orjson.JSONEncodeError:
+            # e.g. non-UTF-8 file names decoded with surrogates; json escapes them
+            pass
+    return json.dumps(data, indent=2)
+
+def _scan_directory(dir_path: str) -> List[Tuple[str, str, bool, bool]]:
+    # (name, path, is_dir, descend); symlinked directories are not descended
+    with os.scandir(dir_path) as it:
+        return [
+            (entry.name, entry.path, entry.is_dir(), entry.is_dir(follow_symlinks=False))
+            for entry in it
+        ]
+
+async def get_file_stats(file_path: str, stat_cache: Optional[StatCache] = None) -> Dict[str, Any]:
+    stat_cache = stat_cache or StatCache()
+    stats = stat_cache.stat(file_path)
     return {
         'size': stats.st_size,
-        'created': datetime.fromtimestamp(stats.st_ctime),
-        'modified': datetime.fromtimestamp(stats.st_mtime),
-        'accessed': datetime.fromtimestamp(stats.st_atime),
-        'isDirectory': os.path.isdir(file_path),
-        'isFile': os.path.isfile(file_path),
+        'created': datetime.datetime.fromtimestamp(stats.st_ctime),
+        'modified': datetime.datetime.fromtimestamp(stats.st_mtime),
+        'accessed': datetime.datetime.fromtimestamp(stats.st_atime),
+        'isDirectory': stat_cache.is_dir(file_path),
+        'isFile': stat_cache.is_file(file_path),
         'permissions': oct(stats.st_mode & 0o777)[-3:],
     }
 
 
-def _matches_exclude(relative_path: str, patterns: List[str]) -> bool:
-    rel_posix = Path(relative_path).as_posix()
+def _compile_excludes(patterns: List[str]) -> Tuple[Optional[Callable[[str], bool]],
+                                                   Optional[Callable[[str], bool]]]:
+    # Bucket globs by shape so the common cases avoid the regex engine.
+    # Returns (matches, excludes_subtree) or (None, None) without patterns.
+    if not patterns:
+        return None, None
+    prefixes: List[str] = []
+    suffixes: List[str] = []
+    substrings: List[str] = []
+    complex_pats: List[str] = []
     for pat in patterns:
         glob_pat = pat if '*' in pat else f"**/{pat}/**"
-        if fnmatch.fnmatch(rel_posix, glob_pat):
-            return True
-    return False
+        core = glob_pat.strip('*')
+        if any(c in core for c in '*?['):
+            complex_pats.append(glob_pat)
+        elif glob_pat.startswith('*') and glob_pat.endswith('*'):
+            substrings.append(core)
+        elif glob_pat.startswith('*'):
+            suffixes.append(core)
+        else:
+            prefixes.append(core)
+
+    prefix_tuple = tuple(prefixes)
+    suffix_tuple = tuple(suffixes)
+    # Remaining globs are translated once and unioned into a single regex
+    complex_re = re.compile("|".join(fnmatch.translate(p) for p in complex_pats)) \
+                 if complex_pats else None
+
+    def matches(rel_posix: str) -> bool:
+        return (rel_posix.startswith(prefix_tuple)
+                or rel_posix.endswith(suffix_tuple)
+                or any(sub in rel_posix for sub in substrings)
+                or (complex_re is not None and complex_re.match(rel_posix) is not None))
+
+    def excludes_subtree(rel_dir: str) -> bool:
+        # Every descendant path starts with rel_dir + '/', so a prefix or
+        # substring hit on it holds for the whole subtree
+        dir_prefix = rel_dir + '/'
+        return (dir_prefix.startswith(prefix_tuple)
+                or any(sub in dir_prefix for sub in substrings))
+
+    return matches, excludes_subtree
 
 def search_files(root_path: str,
                  name_pattern: str,
                  exclude_patterns: List[str] | None = None) -> List[str]:
  
-    exclude_patterns = exclude_patterns or []
+    is_excluded, excludes_subtree = _compile_excludes(exclude_patterns or [])
     results: List[str] = []
 
-    root_path = Path(root_path).resolve()
-
-    def _search(current: Path):
-        try:
-            entries = list(current.iterdir())
-        except PermissionError:
-            return
-
-        for entry in entries:
-            full_path = entry.resolve()          
+    # Reject a search root outside the allowed directories up front
+    root_path = validate_path(root_path)
+    prefix_len = len(root_path.rstrip(os.sep)) + 1
+    # Exclude globs use '/', so relative paths only need converting on Windows
+    needs_posix = os.sep != '/'
+    pattern_lower = name_pattern.lower()
+    # A pattern without cased characters (e.g. "2024", "_-") can skip lowering each name
+    pattern_is_uncased = pattern_lower == name_pattern.upper()
+
+    def _visit(entry: os.DirEntry) -> Optional[str]:
+        # Without following links traversal stays under the validated root,
+        # so only a symlink can point outside the allowed directories
+        if entry.is_symlink():
             try:
-                validate_path(str(full_path))    
+                validate_path(entry.path)
             except Exception:
-                continue                      
+                return None
 
-            relative = full_path.relative_to(root_path)
+        rel_posix = entry.path[prefix_len:]
+        if needs_posix:
+            rel_posix = rel_posix.replace(os.sep, '/')
 
-            if _matches_exclude(relative.as_posix(), exclude_patterns):
-                continue
+        if is_excluded and is_excluded(rel_posix):
+            return None
 
-            if name_pattern.lower() in entry.name.lower():
-                results.append(str(full_path))
+        name = entry.name if pattern_is_uncased else entry.name.lower()
+        if pattern_lower in name:
+            results.append(entry.path)
+        return rel_posix
 
-            if entry.is_dir():
-                _search(full_path)
+    # Iterate each scandir stream directly; only directories still to visit are kept
+    pending = [root_path]
+    while pending:
+        try:
+            it = os.scandir(pending.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                rel_posix = _visit(entry)
+                if rel_posix is None or not entry.is_dir(follow_symlinks=False):
+                    continue
+                # Prune excluded subtrees instead of descending into them
+                if excludes_subtree and excludes_subtree(rel_posix):
+                    continue
+                pending.append(entry.path)
 
-    _search(root_path)
     return results
 
 async def serve(
@@ -180,126 +491,17 @@ async def serve(
     @server.list_tools()
     async def handle_list_tools() -> list[types.Tool]:
         """List available tools."""
-        return [
-            types.Tool(
-                name="read_file",
-                description=(
-                    "Read the complete contents of a file from the file system. "
-                    "Handles various text encodings and provides detailed error messages "
-                    "if the file cannot be read. Use this tool when you need to examine "
-                    "the contents of a single file. Only works within allowed directories."
-                ),
-                inputSchema=ReadFileArgsSchema.model_json_schema(),
-            ),
-            types.Tool(
-                name="read_multiple_files",
-                description=(
-                    "Read the contents of multiple files simultaneously. This is more "
-                    "efficient than reading files one by one when you need to analyze "
-                    "or compare multiple files. Each file's content is returned with its "
-                    "path as a reference. Failed reads for individual files won't stop "
-                    "the entire operation. Only works within allowed directories."
-                ),
-                inputSchema=ReadMultipleFilesArgsSchema.model_json_schema(),
-            ),
-            types.Tool(
-                name="write_file",
-                description=(
-                    "Create a new file or completely overwrite an existing file with new content. "
-                    "Use with caution as it will overwrite existing files without warning. "
-                    "Handles text content with proper encoding. Only works within allowed directories."
-                ),
-                inputSchema=WriteFileArgsSchema.model_json_schema(),
-            ),
-            types.Tool(
-                name="edit_file",
-                description=(
-                    "Make line-based edits to a text file. Each edit replaces exact line sequences "
-                    "with new content. Returns a git-style diff showing the changes made. "
-                    "Only works within allowed directories."
-                ),
-                inputSchema=EditFileArgsSchema.model_json_schema(),
-            ),
-            types.Tool(
-                name="create_directory",
-                description=(
-                    "Create a new directory or ensure a directory exists. Can create multiple "
-                    "nested directories in one operation. If the directory already exists, "
-                    "this operation will succeed silently. Perfect for setting up directory "
-                    "structures for projects or ensuring required paths exist. Only works within allowed directories."
-                ),
-                inputSchema=CreateDirectoryArgsSchema.model_json_schema(),
-            ),
-            types.Tool(
-                name="list_directory",
-                description=(
-                    "Get a detailed listing of all files and directories in a specified path. "
-                    "Results clearly distinguish between files and directories with [FILE] and [DIR] "
-                    "prefixes. This tool is essential for understanding directory structure and "
-                    "finding specific files within a directory. Only works within allowed directories."
-                ),
-                inputSchema=ListDirectoryArgsSchema.model_json_schema(),
-            ),
-            types.Tool(
-                name="directory_tree",
-                description=(
-                    "Get a recursive tree view of files and directories as a JSON structure. "
-                    "Each entry includes 'name', 'type' (file/directory), and 'children' for directories. "
-                    "Files have no children array, while directories always have a children array (which may be empty). "
-                    "The output is formatted with 2-space indentation for readability. Only works within allowed directories."
-                ),
-                inputSchema=DirectoryTreeArgsSchema.model_json_schema(),
-            ),
-            types.Tool(
-                name="move_file",
-                description=(
-                    "Move or rename files and directories. Can move files between directories "
-                    "and rename them in a single operation. If the destination exists, the "
-                    "operation will fail. Works across different directories and can be used "
-                    "for simple renaming within the same directory. Both source and destination must be within allowed directories."
-                ),
-                inputSchema=MoveFileArgsSchema.model_json_schema(),
-            ),
-            types.Tool(
-                name="search_files",
-                description=(
-                    "Recursively search for files and directories matching a pattern. "
-                    "Searches through all subdirectories from the starting path. The search "
-                    "is case-insensitive and matches partial names. Returns full paths to all "
-                    "matching items. Great for finding files when you don't know their exact location. "
-                    "Only searches within allowed directories."
-                ),
-                inputSchema=SearchFilesArgsSchema.model_json_schema(),
-            ),
-            types.Tool(
-                name="get_file_info",
-                description=(
-                    "Retrieve detailed metadata about a file or directory. Returns comprehensive "
-                    "information including size, creation time, last modified time, permissions, "
-                    "and type. This tool is perfect for understanding file characteristics "
-                    "without reading the actual content. Only works within allowed directories."
-                ),
-                inputSchema=GetFileInfoArgsSchema.model_json_schema(),
-            ),
-            types.Tool(
-                name="list_allowed_directories",
-                description=(
-                    "Returns the list of directories that this server is allowed to access. "
-                    "Use this to understand which directories are available before trying to access files."
-                ),
-                inputSchema={"type": "object", "properties": {}, "required": []},
-            ),
-        ]
+        return _TOOLS_LIST
 
 
 
     @server.call_tool()
     async def handle_request(name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+        stat_cache = StatCache()
         try:
             if name == "read_file":
                 file_path = validate_path(args['path'])
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                content = await asyncio.to_thread(_read_file, file_path, stat_cache)
                 return [
                     types.TextContent(
                         type="text", text=content
@@ -307,15 +509,17 @@ async def serve(
                 ]
 
             elif name == "read_multiple_files":
+                # Read all files in worker threads so the waits overlap
+                contents = await asyncio.gather(
+                    *(asyncio.to_thread(_read_validated, file_path) for file_path in args['paths']),
+                    return_exceptions=True,
+                )
                 results = []
-                for file_path in args['paths']:
-                    try:
-                        valid_path = validate_path(file_path)
-                        with open(valid_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
+                for file_path, content in zip(args['paths'], contents):
+                    if isinstance(content, Exception):
+                        results.append(f"{file_path}: Error - {str(content)}")
+                    else:
                         results.append(f"{file_path}:\n{content}")
-                    except Exception as e:
-                        results.append(f"{file_path}: Error - {str(e)}")
                 return [
                     types.TextContent(
                         type="text", text="\n---\n".join(results)
@@ -324,8 +528,8 @@ async def serve(
 
             elif name == "write_file":
                 file_path = validate_path(args['path'])
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(args['content'])
+                await asyncio.to_thread(_write_file, file_path, args['content'])
+                invalidate_path_cache()
                 return [
                     types.TextContent(
                         type="text", text=f"Successfully wrote to {args['path']}"
@@ -341,6 +545,7 @@ async def serve(
             elif name == "create_directory":
                 dir_path = validate_path(args['path'])
                 os.makedirs(dir_path, exist_ok=True)
+                invalidate_path_cache()
                 return [
                     types.TextContent(
                         type="text", text=f"Successfully created directory {args['path']}"
@@ -348,8 +553,8 @@ async def serve(
                 ]
             elif name == "list_directory":
                 dir_path = validate_path(args['path'])
-                entries = os.listdir(dir_path)
-                formatted = "\n".join([f"[DIR] {entry}" if os.path.isdir(os.path.join(dir_path, entry)) else f"[FILE] {entry}" for entry in entries])
+                with os.scandir(dir_path) as it:
+                    formatted = "\n".join([f"[DIR] {entry.name}" if entry.is_dir() else f"[FILE] {entry.name}" for entry in it])
                 return [
                     types.TextContent(
                         type="text", text=formatted
@@ -357,24 +562,35 @@ async def serve(
                 ]             
 
             elif name == "directory_tree":
-                def build_tree(current_path: str) -> List[Dict[str, Any]]:
-                    entries = os.listdir(current_path)
-                    tree = []
-                    for entry in entries:
-                        entry_path = os.path.join(current_path, entry)
-                        tree_entry = {
-                            "name": entry,
-                            "type": "directory" if os.path.isdir(entry_path) else "file",
-                            "children": build_tree(entry_path) if os.path.isdir(entry_path) else []
-                        }
-                        tree.append(tree_entry)
+                async def build_tree(root_path: str) -> List[Dict[str, Any]]:
+                    # Breadth-first walk: at most DIRECTORY_TREE_CONCURRENCY
+                    # directories are scanned (and pending) at once, and an
+                    # error in one batch stops the walk before the next starts
+                    tree: List[Dict[str, Any]] = []
+                    frontier = collections.deque([(root_path, tree)])
+                    while frontier:
+                        batch = [frontier.popleft()
+                                 for _ in range(min(DIRECTORY_TREE_CONCURRENCY, len(frontier)))]
+                        scans = await asyncio.gather(
+                            *(asyncio.to_thread(_scan_directory, dir_path) for dir_path, _ in batch)
+                        )
+                        for (_, children), entries in zip(batch, scans):
+                            for entry_name, entry_path, is_dir, descend in entries:
+                                tree_entry = {
+                                    "name": entry_name,
+                                    "type": "directory" if is_dir else "file",
+                                    "children": []
+                                }
+                                children.append(tree_entry)
+                                if descend:
+                                    frontier.append((entry_path, tree_entry["children"]))
                     return tree
 
                 root_path = validate_path(args['path'])
-                tree_data = build_tree(root_path)
+                tree_data = await build_tree(root_path)
                 return [
                     types.TextContent(
-                        type="text", text=json.dumps(tree_data, indent=2)
+                        type="text", text=_dump_json(tree_data)
                     )
                 ]
 
@@ -382,6 +598,7 @@ async def serve(
                 source_path = validate_path(args['source'])
                 destination_path = validate_path(args['destination'])
                 shutil.move(source_path, destination_path)
+                invalidate_path_cache()
 
                 return [
                     types.TextContent(
@@ -397,7 +614,8 @@ async def serve(
                 ]    
 
             elif name == "get_file_info":
-                file_info = get_file_stats(args['path'])
+                file_path = validate_path(args['path'])
+                file_info = await get_file_stats(file_path, stat_cache)
                 info_text = "\n".join([f"{key}: {value}" for key, value in file_info.items()])
                 return [
                     types.TextContent(
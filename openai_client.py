@@ -17,6 +17,7 @@ class MCPClient:
         self.exit_stack = AsyncExitStack()
         self.client = OpenAI()
         self.session: Optional[ClientSession] = None
+        self.available_tools: list = []
         self.model = os.environ['MODEL']
 
     async def connect_to_server(self, server_script_path: str, *args):
@@ -45,10 +46,22 @@ class MCPClient:
         await self.session.initialize()
 
         # List the tools available
-        response = await self.session.list_tools()
-        tools = response.tools
+        tools = await self.refresh_tools()
         print("\nConnect to the Server, tools available:", [tool.name for tool in tools])
 
+    async def refresh_tools(self):
+        """Fetch the tool list from the server and cache it for later queries"""
+        response = await self.session.list_tools()
+        self.available_tools = [{
+            "type": "function",
+            "function": {
+                "name": tool.name,
+                "description": tool.description,
+                "input_schema": tool.inputSchema
+            }
+        } for tool in response.tools]
+        return response.tools
+
     def get_stream_response(self, response) -> str :
         tool_calls = {} 
         finish_reson = ""
@@ -90,37 +103,31 @@ class MCPClient:
         LLM to process query and use the tools
         """
         messages = [{"role": "user", "content": query}]
-        
-    
-        response = await self.session.list_tools()
-        available_tools = [{
-            "type": "function",
-            "function": {
-                "name": tool.name,
-                "description": tool.description,
-                "input_schema": tool.inputSchema
-            }
-        } for tool in response.tools]
 
         response = self.client.chat.completions.create(
             model=self.model,
             messages=messages,
             stream=stream,
-            tools=available_tools
+            tools=self.available_tools
         )
         if stream :
             finish_reson, tool_calls = self.get_stream_response(response)
 
             if finish_reson == "tool_calls" :
+                calls = []
                 for tool_call in tool_calls.values() :
                     tool_name, tool_args = tool_call["function"]["name"], tool_call["function"]["arguments"]
                     tool_args = json.loads(tool_args)
 
                     print(f"\n\n[Calling tool {tool_name} with args {tool_args}]\n\n")
-                    result = await self.session.call_tool(
+                    calls.append(self.session.call_tool(
                         tool_name,
                         tool_args
-                    )
+                    ))
+
+                # The tool calls are independent, so run them concurrently
+                results = await asyncio.gather(*calls)
+                for tool_call, result in zip(tool_calls.values(), results) :
                     messages.append({
                         "role": "tool",
                         "content": result.content[0].text,